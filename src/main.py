@@ -3,14 +3,16 @@ import logging
 import sys
 import tracker.resources as tr
 from tracker.exceptions import TrackerError
-from tracker.income_expense_tracker import IncomeExpenseTracker
 
 
 def main(argv: list[str]):
     # Receive, verify, and confirm User input specifying month & year of Income&Expense Tracker to update
     try:
         month, year = tr.verify_user_inputs(argv)
-        tr.confirm_proceeding_with_parameters(tr.MONTHS_NUM_TO_NAME[month], year)
+        month_name = tr.MONTHS_NUM_TO_NAME[month]
+        # Make sure config.ini is usable before asking the User to confirm
+        tr.load_transaction_keywords()
+        tr.confirm_proceeding_with_parameters(month_name, year)
     except ValueError as input_error:
         logging.error(f"<{input_error.__class__.__name__}> {input_error}\n")
         sys.exit(tr.EXPECTED_ERR_NO)
@@ -18,54 +20,45 @@ def main(argv: list[str]):
         logging.info(f"<{abort_msg.__class__.__name__}> {abort_msg}\n")
         sys.exit(tr.EXPECTED_ERR_NO)
 
+    # Importing the tracker pulls in openpyxl and pandas, so wait until the User input has been confirmed
+    from tracker.income_expense_tracker import IncomeExpenseTracker, SectionSpec
+    from transaction.transactions import TransactionsError
+
     # Connect to Income&Expense Tracker Sheet corresponding to the month & year input by the User
-    logging.info(f"Connecting to {tr.MONTHS_NUM_TO_NAME[month]} {year} Income & Expense Tracker...")
+    logging.info(f"Connecting to {month_name} {year} Income & Expense Tracker...")
     try:
-        income_expense_tracker = IncomeExpenseTracker(tr.MONTHS_NUM_TO_NAME[month], month, year)
+        income_expense_tracker = IncomeExpenseTracker(month_name, month, year)
     except TrackerError as conn_error:
         logging.error(f"<{conn_error.__class__.__name__}> {conn_error}\n")
         sys.exit(tr.EXPECTED_ERR_NO)
     logging.info("Connection Successful")
 
     # Define/Add sections to the Income&Expense Tracker Sheet, then update the Tracker Sheet
+    section_specs = [
+        SectionSpec("Primary Income", tr.PRIMARY_INCOME_KEYWORDS, min_row=7, max_row=8, min_col=2, max_col=8,
+                    trx_type="income"),
+        SectionSpec("Other Income", tr.PRIMARY_INCOME_KEYWORDS, min_row=12, max_row=166, min_col=2, max_col=8,
+                    trx_type="income", is_inverse_section=True),
+        SectionSpec("Rent & Utilities", tr.RENT_UTIL_KEYWORDS, min_row=7, max_row=14, min_col=10, max_col=16),
+        SectionSpec("Groceries", tr.GROCERY_KEYWORDS, min_row=18, max_row=37, min_col=10, max_col=16,
+                    keyword_exceptions=tr.GAS_KEYWORDS),
+        SectionSpec("Gas", tr.GAS_KEYWORDS, min_row=41, max_row=50, min_col=10, max_col=16),
+        SectionSpec("Miscellaneous Fixed Expenses", tr.FIXED_EXPENSE_KEYWORDS, min_row=54, max_row=63, min_col=10,
+                    max_col=16),
+        SectionSpec("Other Expenses", tr.OTHER_EXPENSE_KEYWORDS, min_row=67, max_row=166, min_col=10, max_col=16,
+                    is_inverse_section=True),
+    ]
     try:
-        income_expense_tracker.add_section("Primary Income", tr.PRIMARY_INCOME_KEYWORDS, min_row=7, max_row=8,
-                                           min_col=2, max_col=8, trx_type="income")
-        logging.info("Added Primary Income Section")
-
-        income_expense_tracker.add_section("Other Income", tr.PRIMARY_INCOME_KEYWORDS, min_row=12, max_row=166,
-                                           min_col=2, max_col=8, trx_type="income", is_inverse_section=True)
-        logging.info("Added Other Income Section")
-
-        income_expense_tracker.add_section("Rent & Utilities", tr.RENT_UTIL_KEYWORDS, min_row=7, max_row=14, min_col=10,
-                                           max_col=16)
-        logging.info("Added Rent & Utilities Section")
-
-        income_expense_tracker.add_section("Groceries", tr.GROCERY_KEYWORDS, min_row=18, max_row=37, min_col=10,
-                                           max_col=16, keyword_exceptions=tr.GAS_KEYWORDS)
-        logging.info("Added Groceries Section")
-
-        income_expense_tracker.add_section("Gas", tr.GAS_KEYWORDS, min_row=41, max_row=50, min_col=10, max_col=16)
-        logging.info("Added Gas Section")
-
-        income_expense_tracker.add_section("Miscellaneous Fixed Expenses", tr.FIXED_EXPENSE_KEYWORDS, min_row=54,
-                                           max_row=63, min_col=10, max_col=16)
-        logging.info("Added Miscellaneous Fixed Expenses Section")
-
-        income_expense_tracker.add_section("Other Expenses", tr.RENT_UTIL_KEYWORDS + tr.GROCERY_KEYWORDS +
-                                           tr.GAS_KEYWORDS + tr.FIXED_EXPENSE_KEYWORDS, min_row=67, max_row=166,
-                                           min_col=10, max_col=16, is_inverse_section=True)
-        logging.info("Added Other Expenses Section")
-
+        income_expense_tracker.add_sections(section_specs)
         income_expense_tracker.update_tracker()
-    except TrackerError as te:
-        logging.error(f"<{te.__class__.__name__}> {te}\n")
+    except (TrackerError, TransactionsError) as update_error:
+        logging.error(f"<{update_error.__class__.__name__}> {update_error}\n")
         sys.exit(tr.EXPECTED_ERR_NO)
     finally:
-        logging.info(f"Closing connection to {tr.MONTHS_NUM_TO_NAME[month]} {year} Income & Expense Tracker")
+        logging.info(f"Closing connection to {month_name} {year} Income & Expense Tracker")
         income_expense_tracker.close_tracker()
 
-    logging.info(f"Successfully Updated {tr.MONTHS_NUM_TO_NAME[month]} {year} Income & Expense Tracker")
+    logging.info(f"Successfully Updated {month_name} {year} Income & Expense Tracker")
 
 
 if __name__ == "__main__":
@@ -2,6 +2,8 @@
 
 Classes
 -------
+SectionSpec
+    Describes a TrackerSection to be added to the Income & Expense Tracker
 TrackerSection
     Defines a group of cells in the Income/Excel Tracker Excel Workbook that are used for a particular category
 IncomeExpenseTracker
@@ -9,15 +11,55 @@ IncomeExpenseTracker
 """
 import logging
 import openpyxl
+import os
 import pandas as pd
+import re
+import shutil
+import tempfile
 import tracker.exceptions
+import weakref
 from openpyxl.cell.cell import Cell
 from openpyxl.workbook.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
-from tracker.resources import PROJECT_ROOT_PATH
+from tracker.resources import PROJECT_ROOT_PATH, compile_keywords
 from transaction.transactions import Transactions
 from transaction.dao.transaction_dao import FlatFileTransactionDAO
-from typing import Callable, Optional
+from typing import Callable, NamedTuple, Optional
+
+
+class SectionSpec(NamedTuple):
+    """Class describing a TrackerSection to be added to the Income & Expense Tracker
+
+    Instance Variables
+    ------------------
+    name : str
+        Category name
+    keywords : list[str]
+        List of keywords to search for in transaction descriptions
+    min_row : int
+        Row number the section starts at
+    max_row : int
+        Row number the section ends at
+    min_col : int
+        Column number the section starts at
+    max_col : int
+        Column number the section ends at
+    trx_type : str, default "expense"
+        Designates the transactions that make up this section as either income or expense
+    keyword_exceptions : list[str], default None
+        List of keywords that should disqualify a transaction from belonging to the category
+    is_inverse_section : bool, default False
+        Whether the section should treat keywords as qualifiers for section membership or dis-qualifiers
+    """
+    name: str
+    keywords: list[str]
+    min_row: int
+    max_row: int
+    min_col: int
+    max_col: int
+    trx_type: str = "expense"
+    keyword_exceptions: list[str] = None
+    is_inverse_section: bool = False
 
 
 class TrackerSection:
@@ -25,6 +67,9 @@ class TrackerSection:
     Class representing a collection of cells within the Income & Expense Tracker Excel Workbook to catalog a category
     of transactions
 
+    A section's filtering, cell coordinates, equality, and hash are all derived from its definition when it is
+    constructed, so the instance variables below are read-only. To change a section, construct a new one.
+
     Instance Variables
     ------------------
     name : str
@@ -33,8 +78,8 @@ class TrackerSection:
         Excel worksheet the collection of cells belong to
     trx_type : str, "income" or "expense"
         Designates the transactions that make up this section as either income or expense
-    keywords : list[str]
-        List of keywords to search for in transaction descriptions
+    keywords : tuple[str, ...]
+        Keywords to search for in transaction descriptions
     min_row : int
         Row number the section starts at
     max_row : int
@@ -43,8 +88,8 @@ class TrackerSection:
         Column number the section starts at
     max_col : int
         Column number the section ends at
-    keyword_exceptions : list[str]
-        List of keywords that should disqualify a transaction from belonging to the category
+    keyword_exceptions : tuple[str, ...]
+        Keywords that should disqualify a transaction from belonging to the category
     is_inverse_section : bool
         Whether the section should treat keywords as qualifiers for section membership or dis-qualifiers
 
@@ -52,9 +97,12 @@ class TrackerSection:
     --------------
     clear_contents(self)
         Delete data from every cell in the section
-    write_data(self, transactions: pd.DataFrame)
+    write_data(self, transactions: pd.DataFrame, descriptions: Optional[pd.Series])
         Write transaction data to the cells in the section
     """
+    __slots__ = ("__name", "__xl_worksheet", "__trx_type", "__keywords", "__min_row", "__max_row", "__min_col",
+                 "__max_col", "__keyword_exceptions", "__is_inverse_section", "__keyword_pattern",
+                 "__keyword_exception_pattern", "__trx_filter", "__cell_coordinates", "__fingerprint")
 
     def __init__(self, name: str, xl_worksheet: Worksheet, trx_type: str, keywords: list[str], min_row: int,
                  max_row: int, min_col: int, max_col: int, keyword_exceptions: list[str] = None,
@@ -92,34 +140,100 @@ class TrackerSection:
         if trx_type not in ["expense", "income"]:
             raise tracker.exceptions.InvalidTrxType(f"TrackerSection requires \"expense\" or \"income\" for trx_type, "
                                                     f"got \"{trx_type}\"")
-        # Public instance variables
-        self.name: str = name
-        self.xl_worksheet: Worksheet = xl_worksheet
-        self.trx_type: str = trx_type
-        self.keywords: list[str] = keywords
-        self.min_row: int = min_row
-        self.max_row: int = max_row
-        self.min_col: int = min_col
-        self.max_col: int = max_col
-        self.keyword_exceptions: list[str] = [] if keyword_exceptions is None else keyword_exceptions
-        self.is_inverse_section: bool = is_inverse_section
+        # Public, read-only instance variables
+        self.__name: str = name
+        self.__xl_worksheet: Worksheet = xl_worksheet
+        self.__trx_type: str = trx_type
+        self.__keywords: tuple[str, ...] = tuple(keywords)
+        self.__min_row: int = min_row
+        self.__max_row: int = max_row
+        self.__min_col: int = min_col
+        self.__max_col: int = max_col
+        self.__keyword_exceptions: tuple[str, ...] = () if keyword_exceptions is None else tuple(keyword_exceptions)
+        self.__is_inverse_section: bool = is_inverse_section
+        # Private instance variables
+        self.__keyword_pattern: re.Pattern = compile_keywords(self.keywords)
+        self.__keyword_exception_pattern: re.Pattern = compile_keywords(self.keyword_exceptions)
+        self.__trx_filter: Callable[[pd.Series], pd.Series] = self.__build_trx_filter()
+        # Coordinates of every cell in the section
+        self.__cell_coordinates: tuple[tuple[int, int], ...] = tuple((row, col)
+                                                                     for row in range(min_row, max_row + 1)
+                                                                     for col in range(min_col, max_col + 1))
+        # Everything that defines the section, with keywords as sets since their order doesn't affect matching
+        self.__fingerprint: tuple = (self.name, self.trx_type, self.min_row, self.max_row, self.min_col, self.max_col,
+                                     frozenset(self.keywords), frozenset(self.keyword_exceptions),
+                                     self.is_inverse_section)
+
+    # Read-only instance variables
+    @property
+    def name(self) -> str:
+        """Category name"""
+        return self.__name
+
+    @property
+    def xl_worksheet(self) -> Worksheet:
+        """Excel worksheet the collection of cells belong to"""
+        return self.__xl_worksheet
+
+    @property
+    def trx_type(self) -> str:
+        """Designates the transactions that make up this section as either income or expense"""
+        return self.__trx_type
+
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        """Keywords to search for in transaction descriptions"""
+        return self.__keywords
+
+    @property
+    def min_row(self) -> int:
+        """Row number the section starts at"""
+        return self.__min_row
+
+    @property
+    def max_row(self) -> int:
+        """Row number the section ends at"""
+        return self.__max_row
+
+    @property
+    def min_col(self) -> int:
+        """Column number the section starts at"""
+        return self.__min_col
+
+    @property
+    def max_col(self) -> int:
+        """Column number the section ends at"""
+        return self.__max_col
+
+    @property
+    def keyword_exceptions(self) -> tuple[str, ...]:
+        """Keywords that should disqualify a transaction from belonging to the category"""
+        return self.__keyword_exceptions
+
+    @property
+    def is_inverse_section(self) -> bool:
+        """Whether the section should treat keywords as qualifiers for section membership or dis-qualifiers"""
+        return self.__is_inverse_section
 
     # Public methods
     def clear_contents(self):
         """Deletes data from every cell in the TrackerSection"""
-        for row in self.xl_worksheet.iter_rows(min_row=self.min_row, min_col=self.min_col, max_row=self.max_row,
-                                               max_col=self.max_col):
-            for cell in row:
-                if isinstance(cell, Cell):
-                    cell.value = None
-
-    def write_data(self, transactions: pd.DataFrame):
+        # Empty each existing, unmerged cell that holds a value, leaving the cell and its style in place
+        cells = self.xl_worksheet._cells
+        for coordinate in self.__cell_coordinates:
+            cell = cells.get(coordinate)
+            if isinstance(cell, Cell) and cell.value is not None:
+                cell.value = None
+
+    def write_data(self, transactions: pd.DataFrame, descriptions: Optional[pd.Series] = None):
         """Write transaction data to the cells of the TrackerSection
 
         Parameters
         ----------
         transactions : pd.DataFrame
             Table of either all income or all expense transactions for the period
+        descriptions : pd.Series, default None
+            Upper case descriptions of the transactions, sharing their index. Derived from transactions if not provided
 
         Raises
         ------
@@ -128,59 +242,94 @@ class TrackerSection:
             TrackerSection
         """
         # From transaction data passed into the method, filter for transactions relevant to this section only
-        section_trx: pd.DataFrame = transactions.loc[list(map(self.__trx_filter(), transactions['Description'])), :]
-        section_trx.reset_index(drop=True, inplace=True)
+        section_trx = self.__filter_transactions(transactions, descriptions)
         # Confirm the section is large enough to display the transactions that belong to it
         if len(section_trx) > (self.max_row - self.min_row + 1):
             raise tracker.exceptions.InsufficientTrackerSectionSize(f"TrackerSection \"{self.name}\" transactions "
                                                                     f"({len(section_trx)}) exceeds row allowance "
                                                                     f"({self.max_row - self.min_row + 1})")
-
-        # The Date, Description, and Amount columns begin at the section's first, second, and last columns respectively
-        date_column = chr(64 + self.min_col)
-        desc_column = chr(64 + self.min_col + 1)
-        amt_column = chr(64 + self.max_col)
-        # For each transaction belonging to this section, write info to their respective columns
-        for idx, row in section_trx.iterrows():
-            self.xl_worksheet[f"{date_column}{str(self.min_row + idx)}"] = row['Posting Date']
-            self.xl_worksheet[f"{desc_column}{str(self.min_row + idx)}"] = row['Description']
-            self.xl_worksheet[f"{amt_column}{str(self.min_row + idx)}"] = row['Amount']
+        self.__write_rows(section_trx)
 
     # Private methods
-    def __trx_filter(self) -> Callable[[str], bool]:
+    def __build_trx_filter(self) -> Callable[[pd.Series], pd.Series]:
         """
         Defines how to filter the table of all transactions into just the transactions relevant to the
         TrackerSection
 
         Returns
         -------
-        Callable[[str], bool]
-            Function that will determine if keywords are found or not found in a string passed in as the argument
+        Callable[[pd.Series], pd.Series]
+            Function that will determine, for every upper case transaction description in the Series passed in as the
+            argument at once, if keywords are found or not found in it
         """
         # If this section IS marked as inverse, then filter for transactions that do NOT contain the provided keywords
         if self.is_inverse_section:
             if len(self.keyword_exceptions) == 0:
-                return lambda text: all(key_word not in text.upper() for key_word in self.keywords)
+                return lambda descriptions: ~descriptions.str.contains(self.__keyword_pattern, na=False)
             # If there are keyword exceptions, make sure they are not included when filtering
             else:
-                return lambda text: all(key_word not in text.upper() for key_word in self.keywords) or \
-                                    any(kw_ex in text.upper() for kw_ex in self.keyword_exceptions)
+                return lambda descriptions: ~descriptions.str.contains(self.__keyword_pattern, na=False) | \
+                                            descriptions.str.contains(self.__keyword_exception_pattern, na=False)
         # If this section is NOT marked as inverse, then filter for transactions that DO contain the provided keywords
         else:
             if len(self.keyword_exceptions) == 0:
-                return lambda text: any(key_word in text.upper() for key_word in self.keywords)
+                return lambda descriptions: descriptions.str.contains(self.__keyword_pattern, na=False)
             # If there are keyword exceptions, make sure they are not included when filtering
             else:
-                return lambda text: (any(key_word in text.upper() for key_word in self.keywords)) and \
-                                    all(kw_ex not in text.upper() for kw_ex in self.keyword_exceptions)
+                return lambda descriptions: descriptions.str.contains(self.__keyword_pattern, na=False) & \
+                                            ~descriptions.str.contains(self.__keyword_exception_pattern, na=False)
+
+    def __filter_transactions(self, transactions: pd.DataFrame, descriptions: Optional[pd.Series]) -> pd.DataFrame:
+        """Filter the table of transactions into just the transactions relevant to the TrackerSection
+
+        Parameters
+        ----------
+        transactions : pd.DataFrame
+            Table of either all income or all expense transactions for the period
+        descriptions : pd.Series, optional
+            Upper case descriptions of the transactions, sharing their index. Derived from transactions if None
+
+        Returns
+        -------
+        pd.DataFrame
+            Table of the transactions belonging to the TrackerSection
+        """
+        # Keywords are matched against upper case descriptions
+        if descriptions is None:
+            descriptions = transactions['Description'].str.upper()
+        # descriptions shares the transactions' index, so select rows positionally with the mask's boolean array
+        return transactions.loc[self.__trx_filter(descriptions).to_numpy(dtype=bool), :]
+
+    def __write_rows(self, section_trx: pd.DataFrame):
+        """Write each transaction belonging to the TrackerSection to its own row of the section
+
+        Parameters
+        ----------
+        section_trx : pd.DataFrame
+            Table of the transactions belonging to the TrackerSection
+        """
+        # Extract columns as lists of Python objects, since openpyxl cannot write numpy's datetime64 values
+        posting_dates = section_trx['Posting Date'].tolist()
+        descriptions = section_trx['Description'].tolist()
+        amounts = section_trx['Amount'].tolist()
+        # The Date, Description, and Amount columns begin at the section's first, second, and last columns respectively
+        date_col, desc_col, amt_col = self.min_col, self.min_col + 1, self.max_col
+        write_cell = self.xl_worksheet.cell
+        # For each transaction belonging to this section, write info to their respective columns
+        for row, (posting_date, description, amount) in enumerate(zip(posting_dates, descriptions, amounts),
+                                                                  start=self.min_row):
+            write_cell(row, date_col, posting_date)
+            write_cell(row, desc_col, description)
+            write_cell(row, amt_col, amount)
 
     # Magic methods
     def __eq__(self, other) -> bool:
-        return self.name == other.name and self.trx_type == other.trx_type \
-               and self.min_row == other.min_row and self.max_row == other.max_row \
-               and self.min_col == other.min_col and self.max_col == other.max_col \
-               and self.keywords == other.keywords and self.keyword_exceptions == other.keyword_exceptions \
-               and self.is_inverse_section == other.is_inverse_section
+        if not isinstance(other, TrackerSection):
+            return NotImplemented
+        return self.__fingerprint == other.__fingerprint
+
+    def __hash__(self) -> int:
+        return hash(self.__fingerprint)
 
 
 class IncomeExpenseTracker:
@@ -207,6 +356,8 @@ class IncomeExpenseTracker:
     add_section(self, name, keywords, min_row, max_row, min_col, max_col, trx_type, keyword_exceptions,
     is_inverse_section)
         Add instance of TrackerSection to the Income & Expense Tracker
+    add_sections(self, section_specs)
+        Add an instance of TrackerSection to the Income & Expense Tracker for each SectionSpec provided
     close_tracker(self)
         Close the connection to the Excel Workbook
     delete_section(self, name)
@@ -220,6 +371,9 @@ class IncomeExpenseTracker:
     # Class variables
     AS_OF_DATE_CELL = "T1"
     TRACKER_ROOT_PATH = f"{PROJECT_ROOT_PATH}/Tracker"
+    # Workbooks currently in use by a tracker, keyed by file path, so that trackers for different months of the same
+    # year share a single loaded workbook. Entries are dropped once no tracker holds a reference to the workbook.
+    __open_workbooks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
 
     def __init__(self, month_name: str, month_num: int, year: int):
         """Constructor for IncomeExpenseTracker Class
@@ -248,7 +402,7 @@ class IncomeExpenseTracker:
         self.__transactions: Optional[Transactions] = None
         self.__xl_workbook_path: str = f"{self.__class__.TRACKER_ROOT_PATH}/{year}/Income&Expenses{year}.xlsx"
         try:
-            self.__xl_workbook: Workbook = openpyxl.load_workbook(self.__xl_workbook_path)
+            self.__xl_workbook: Workbook = self.__get_workbook(self.__xl_workbook_path)
             self.__xl_worksheet: Worksheet = self.__xl_workbook[f"{month_name} {year}"]
         except FileNotFoundError as fnf_err:
             raise tracker.exceptions.TrackerWorkbookDoesNotExist(fnf_err)
@@ -287,7 +441,7 @@ class IncomeExpenseTracker:
         tracker.exceptions.TrackerSectionAlreadyExists
             If the section attempting to be added already exists in the tracker
         """
-        if name in self.__sections.keys():
+        if name in self.__sections:
             raise tracker.exceptions.TrackerSectionAlreadyExists(f"Section \"{name}\" already exists. If you'd like to "
                                                                  f"replace the existing section, make a call to the "
                                                                  f"\"replace_section()\" method instead.")
@@ -296,6 +450,23 @@ class IncomeExpenseTracker:
                                  keyword_exceptions, is_inverse_section)
         self.__sections[section.name] = section
 
+    def add_sections(self, section_specs: list[SectionSpec]):
+        """Add a section to the tracker for each section specification provided
+
+        Parameters
+        ----------
+        section_specs : list[SectionSpec]
+            Specifications of the sections to add, in the order they should be added
+
+        Raises
+        ------
+        tracker.exceptions.TrackerSectionAlreadyExists
+            If a section attempting to be added already exists in the tracker
+        """
+        for spec in section_specs:
+            self.add_section(*spec)
+            logging.info(f"Added {spec.name} Section")
+
     def close_tracker(self):
         """Close connection to the Income & Expense Tracker Excel Workbook"""
         if self.__xl_workbook:
@@ -314,7 +485,7 @@ class IncomeExpenseTracker:
         tracker.exceptions.TrackerSectionDoesNotExist
             If the name provided does not correspond to an existing section within the tracker
         """
-        if name not in self.__sections.keys():
+        if name not in self.__sections:
             raise tracker.exceptions.TrackerSectionDoesNotExist(f"Cannot delete section \"{name}\" because it does "
                                                                 f"not exist")
         del self.__sections[name]
@@ -352,7 +523,7 @@ class IncomeExpenseTracker:
         tracker.exceptions.ReplaceTrackerSectionError
             If the replacement section is identical to the already existing section within the tracker
         """
-        if name not in self.__sections.keys():
+        if name not in self.__sections:
             raise tracker.exceptions.TrackerSectionDoesNotExist(f"Cannot replace section \"{name}\" because it does "
                                                                 f"not exist")
 
@@ -370,6 +541,8 @@ class IncomeExpenseTracker:
         ------
         tracker.exceptions.EmptyTrackerError
             If the tracker has no sections assigned to it
+        transaction.transactions.TransactionsError
+            If the transactions for the period cannot be pulled
         """
         if len(self.__sections) == 0:
             raise tracker.exceptions.EmptyTrackerError(f"{self.month_name} {self.year} Income & Expense Tracker "
@@ -382,7 +555,7 @@ class IncomeExpenseTracker:
         logging.info(f"Writing Updated {self.month_name} {self.year} Transactions Data to Tracker")
         self.__write_transaction_data_to_tracker()
         logging.info(f"Saving Updates to {self.month_name} {self.year} Income & Expense Tracker")
-        self.__xl_workbook.save(self.__xl_workbook_path)
+        self.__save_workbook()
 
     # Private methods
     def __clear_tracker_contents(self):
@@ -399,13 +572,57 @@ class IncomeExpenseTracker:
 
         self.__transactions.get_transactions_for_the_period()
 
+    @classmethod
+    def __get_workbook(cls, xl_workbook_path: str) -> Workbook:
+        """Return the workbook at the provided path, only loading it if no other tracker is already using it
+
+        Parameters
+        ----------
+        xl_workbook_path : str
+            File path to the Income & Expense Tracker Excel Workbook
+
+        Returns
+        -------
+        Workbook
+            Income & Expense Tracker Excel Workbook
+
+        Raises
+        ------
+        FileNotFoundError
+            If the Income & Expense Tracker Excel Workbook cannot be found
+        """
+        xl_workbook = cls.__open_workbooks.get(xl_workbook_path)
+        if xl_workbook is None:
+            xl_workbook = openpyxl.load_workbook(xl_workbook_path)
+            cls.__open_workbooks[xl_workbook_path] = xl_workbook
+        return xl_workbook
+
+    def __save_workbook(self):
+        """Save the Income & Expense Tracker Excel Workbook without risking a partially written file
+
+        The workbook is saved to a temporary file in the same directory as the original, given the original's
+        permissions, and then swapped in for the original in a single step. If the workbook path is a symlink, the file
+        it points to is replaced, leaving the symlink intact. If saving fails, the original workbook is left untouched.
+        """
+        xl_workbook_real_path = os.path.realpath(self.__xl_workbook_path)
+        tmp_fd, tmp_xl_workbook_path = tempfile.mkstemp(prefix=f".{os.path.basename(xl_workbook_real_path)}.",
+                                                        suffix=".tmp", dir=os.path.dirname(xl_workbook_real_path))
+        os.close(tmp_fd)
+        try:
+            self.__xl_workbook.save(tmp_xl_workbook_path)
+            shutil.copymode(xl_workbook_real_path, tmp_xl_workbook_path)
+            os.replace(tmp_xl_workbook_path, xl_workbook_real_path)
+        except BaseException:
+            if os.path.exists(tmp_xl_workbook_path):
+                os.remove(tmp_xl_workbook_path)
+            raise
+
     def __write_transaction_data_to_tracker(self):
         """Write latest transaction data to each section in the tracker"""
         self.__xl_worksheet[self.__class__.AS_OF_DATE_CELL] = self.__transactions.get_as_of_date()
+        # Share each trx_type's transactions and upper case descriptions across the sections of that trx_type
+        trx_getters = {"expense": self.__transactions.get_expenses, "income": self.__transactions.get_income}
+        trx = {trx_type: trx_getters[trx_type]() for trx_type in {sect.trx_type for sect in self.__sections.values()}}
+        descriptions = {trx_type: trx_of_type['Description'].str.upper() for trx_type, trx_of_type in trx.items()}
         for section in self.__sections.values():
-            # Determine if base transactions the section should filter from should be expense or income transactions
-            if section.trx_type == "expense":
-                trx = self.__transactions.get_expenses()
-            else:
-                trx = self.__transactions.get_income()
-            section.write_data(trx)
+            section.write_data(trx[section.trx_type], descriptions[section.trx_type])
@@ -21,6 +21,9 @@ GAS_KEYWORDS : list[str]
 GROCERY_KEYWORDS : list[str]
     List of keywords to search for in transaction descriptions that qualify the transaction as part of the groceries
     category
+OTHER_EXPENSE_KEYWORDS : list[str]
+    List of keywords to search for in transaction descriptions that disqualify the transaction from being part of the
+    Other Expenses category
 PRIMARY_INCOME_KEYWORDS : list[str]
     List of keywords to search for in transaction descriptions that qualify the transaction as part of the Primary
     Income category
@@ -28,16 +31,24 @@ RENT_UTIL_KEYWORDS : list[str]
     List of keywords to search for in transaction descriptions that qualify the transaction as part of the Rent &
     Utilities category
 
+All keyword lists are in upper case, and are read from config.ini the first time any of them is accessed.
+
 Functions
 ---------
+compile_keywords(keywords: list[str]) -> re.Pattern
+    Compile a list of keywords into a single pattern that matches any one of the keywords
 confirm_proceeding_with_parameters(month: str, year: int)
     Confirm the month and year parameters input by the user before proceeding with update
+load_transaction_keywords()
+    Read the transaction keyword constants from config.ini, if they have not been read already
 verify_user_inputs(argv: list[str]) -> tuple[int, int]
     Verify inputs from the user match expectations
 """
 import configparser
+import functools
 import logging
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -52,35 +63,137 @@ MONTHS_NUM_TO_NAME = {1: "January", 2: "February", 3: "March", 4: "April", 5: "M
 # main.py is executed from src/ whose parent directory is the project root directory: ExpenseTracker/
 PROJECT_ROOT_PATH = str(Path(sys.path[0]).parent)
 
+
 # Set up ConfigParser
-expected_config_filepath = f"{PROJECT_ROOT_PATH}/config.ini"
-config_file = expected_config_filepath if os.path.isfile(expected_config_filepath) else None
-try:
-    if not config_file:
-        raise FileNotFoundError(f"Missing \"config.ini\" file in the project root directory: {PROJECT_ROOT_PATH}")
-except FileNotFoundError as config_error:
-    logging.error(f"<{config_error.__class__.__name__}> {config_error}\n")
-    sys.exit(EXPECTED_ERR_NO)
-config = configparser.ConfigParser()
-config.read(config_file)
-
-# Define keywords to search for in transaction descriptions when grouping transactions into categories
-try:
-    CREDIT_CARD_KEYWORDS = config.get("Transaction Keywords", "CREDIT_CARD").split(",")
-    FIXED_EXPENSE_KEYWORDS = config.get("Transaction Keywords", "FIXED_EXPENSES").split(",")
-    GAS_KEYWORDS = config.get("Transaction Keywords", "GASOLINE").split(",")
-    GROCERY_KEYWORDS = config.get("Transaction Keywords", "GROCERIES").split(",")
-    PRIMARY_INCOME_KEYWORDS = config.get("Transaction Keywords", "PRIMARY_INCOME").split(",")
-    RENT_UTIL_KEYWORDS = config.get("Transaction Keywords", "RENT_UTIL").split(",")
-except configparser.NoSectionError as nse:
-    logging.error(f"<{nse.__class__.__name__}> {nse}\n")
-    sys.exit(EXPECTED_ERR_NO)
-except configparser.NoOptionError as noe:
-    logging.error(f"<{noe.__class__.__name__}> {noe}\n")
-    sys.exit(EXPECTED_ERR_NO)
+def _load_config() -> configparser.ConfigParser:
+    """Locate and parse the config.ini file in the project root directory
+
+    Returns
+    -------
+    configparser.ConfigParser
+        Parsed contents of the config.ini file
+
+    Raises
+    ------
+    SystemExit
+        If the config.ini file is missing from the project root directory
+    """
+    expected_config_filepath = f"{PROJECT_ROOT_PATH}/config.ini"
+    try:
+        if not os.path.isfile(expected_config_filepath):
+            raise FileNotFoundError(f"Missing \"config.ini\" file in the project root directory: {PROJECT_ROOT_PATH}")
+    except FileNotFoundError as config_error:
+        logging.error(f"<{config_error.__class__.__name__}> {config_error}\n")
+        sys.exit(EXPECTED_ERR_NO)
+    parsed_config = configparser.ConfigParser()
+    parsed_config.read(expected_config_filepath)
+    return parsed_config
+
+
+# Transaction keyword constants, mapped to their options in the "Transaction Keywords" section of config.ini
+_KEYWORD_CONFIG_OPTIONS = {"CREDIT_CARD_KEYWORDS": "CREDIT_CARD", "FIXED_EXPENSE_KEYWORDS": "FIXED_EXPENSES",
+                           "GAS_KEYWORDS": "GASOLINE", "GROCERY_KEYWORDS": "GROCERIES",
+                           "PRIMARY_INCOME_KEYWORDS": "PRIMARY_INCOME", "RENT_UTIL_KEYWORDS": "RENT_UTIL"}
+
+
+def __getattr__(name: str) -> list[str]:
+    """Load the transaction keyword constants the first time any of them is accessed
+
+    Importing the module doesn't read config.ini, so code that never uses the keywords doesn't need it. Once loaded,
+    the keywords are stored as module globals, so this is not called again for them.
+
+    Parameters
+    ----------
+    name : str
+        Name of the module attribute being accessed
+
+    Returns
+    -------
+    list[str]
+        The keyword constant being accessed
+
+    Raises
+    ------
+    AttributeError
+        If the attribute is not one of the transaction keyword constants
+    """
+    if name not in _KEYWORD_CONFIG_OPTIONS and name != "OTHER_EXPENSE_KEYWORDS":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    load_transaction_keywords()
+    return globals()[name]
+
+
+def _load_keywords() -> dict[str, list[str]]:
+    """Read the keywords to search for in transaction descriptions when grouping transactions into categories
+
+    Returns
+    -------
+    dict[str, list[str]]
+        Mapping from the name of each keyword constant to its upper case keywords
+
+    Raises
+    ------
+    SystemExit
+        If the "Transaction Keywords" section or one of its options is missing from config.ini
+    """
+    config = _load_config()
+    # Descriptions are matched in upper case, so keywords are stored in upper case
+    try:
+        keywords = {name: config.get("Transaction Keywords", option).upper().split(",")
+                    for name, option in _KEYWORD_CONFIG_OPTIONS.items()}
+    except configparser.NoSectionError as nse:
+        logging.error(f"<{nse.__class__.__name__}> {nse}\n")
+        sys.exit(EXPECTED_ERR_NO)
+    except configparser.NoOptionError as noe:
+        logging.error(f"<{noe.__class__.__name__}> {noe}\n")
+        sys.exit(EXPECTED_ERR_NO)
+    # Other Expenses are any expenses that do not belong to one of the other expense categories
+    keywords["OTHER_EXPENSE_KEYWORDS"] = list(dict.fromkeys(keywords["RENT_UTIL_KEYWORDS"] +
+                                                            keywords["GROCERY_KEYWORDS"] + keywords["GAS_KEYWORDS"] +
+                                                            keywords["FIXED_EXPENSE_KEYWORDS"]))
+    return keywords
 
 
 # Functions
+def compile_keywords(keywords: list[str]) -> re.Pattern:
+    """Compile a list of keywords into a single pattern that matches any one of the keywords
+
+    Searching a transaction description with the compiled pattern scans the description once, rather than once per
+    keyword. Keywords are converted to upper case, so the pattern should be searched against upper case descriptions.
+
+    Parameters
+    ----------
+    keywords : list[str]
+        List of keywords to search for in transaction descriptions
+
+    Returns
+    -------
+    re.Pattern
+        Pattern matching any of the upper case keywords. If no keywords are provided, the pattern never matches.
+    """
+    return _compile_keywords(frozenset(keywords))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_keywords(keywords: frozenset[str]) -> re.Pattern:
+    """Compile keywords into a single pattern that matches any one of the keywords, caching the pattern for each
+    distinct set of keywords
+
+    Parameters
+    ----------
+    keywords : frozenset[str]
+        Set of keywords to search for in transaction descriptions
+
+    Returns
+    -------
+    re.Pattern
+        Pattern matching any of the upper case keywords. If no keywords are provided, the pattern never matches.
+    """
+    if len(keywords) == 0:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(re.escape(keyword.upper()) for keyword in keywords))
+
+
 def confirm_proceeding_with_parameters(month: str, year: int):
     """Confirm the month and year parameters input by the user before proceeding with update
 
@@ -96,17 +209,31 @@ def confirm_proceeding_with_parameters(month: str, year: int):
     KeyboardInterrupt
         If the user's response to the prompt begins with "n", disregarding case
     """
-    proceed = False
-    user_response = ""
-
-    while not proceed:
-        user_response = input(f"Are you sure you want to update {month} {year} Income & Expenses? (y/n): ").lower()
-        proceed = user_response.startswith("y") or user_response.startswith("n")
+    # Only the first character of the response matters, so keep prompting until it is either "y" or "n"
+    while True:
+        user_response = input(f"Are you sure you want to update {month} {year} Income & Expenses? (y/n): ")[:1].lower()
+        if user_response in ("y", "n"):
+            break
 
-    if user_response.startswith("n"):
+    if user_response == "n":
         raise KeyboardInterrupt("Income & Expenses Update Cancelled")
 
 
+def load_transaction_keywords():
+    """Read the transaction keyword constants from config.ini, if they have not been read already
+
+    The keywords are otherwise read the first time any of them is accessed. Call this to surface a missing or
+    incomplete config.ini up front instead.
+
+    Raises
+    ------
+    SystemExit
+        If config.ini is missing, or is missing the "Transaction Keywords" section or one of its options
+    """
+    if "CREDIT_CARD_KEYWORDS" not in globals():
+        globals().update(_load_keywords())
+
+
 def verify_user_inputs(argv: list[str]) -> tuple[int, int]:
     """Verify inputs from the user match expectations
 
@@ -120,6 +247,28 @@ def verify_user_inputs(argv: list[str]) -> tuple[int, int]:
     tuple[int, int]
         The month and year of the Income & Expenses sheet to update
 
+    Raises
+    ------
+    ValueError
+        If user inputs do not meet expectations
+    """
+    return _verify_user_inputs(tuple(argv))
+
+
+@functools.lru_cache(maxsize=64)
+def _verify_user_inputs(argv: tuple[str, ...]) -> tuple[int, int]:
+    """Verify inputs from the user match expectations, caching the result for each distinct set of inputs
+
+    Parameters
+    ----------
+    argv : tuple[str, ...]
+        User inputs
+
+    Returns
+    -------
+    tuple[int, int]
+        The month and year of the Income & Expenses sheet to update
+
     Raises
     ------
     ValueError
@@ -141,14 +290,13 @@ def verify_user_inputs(argv: list[str]) -> tuple[int, int]:
         raise ValueError(f"Year should be input immediately following the month as a 4-digit code (YYYY): "
                          f"\"{argv[year_input_idx]}\"")
 
-    try:
-        month = int(argv[month_input_idx])
-    except ValueError:
+    # Month and year must be all digits before they are converted
+    if not argv[month_input_idx].isdecimal():
         raise ValueError(f"Invalid month parameter: {argv[month_input_idx]}")
-    try:
-        year = int(argv[year_input_idx])
-    except ValueError:
+    if not argv[year_input_idx].isdecimal():
         raise ValueError(f"Invalid year parameter: {argv[year_input_idx]}")
+    month = int(argv[month_input_idx])
+    year = int(argv[year_input_idx])
 
     if not 1 <= month <= 12:
         raise ValueError(f"Invalid month parameter: {argv[month_input_idx]}. Expected month between 01 and 12")
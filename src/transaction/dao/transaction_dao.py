@@ -11,8 +11,10 @@ FlatFileTransactionDAO
 APITransactionDAO
     Concrete Class for pulling bank account transaction data using bank's API
 """
+import os
 import pandas as pd
 from abc import ABC, abstractmethod
+from typing import Optional
 
 
 class TransactionDataPullError(Exception):
@@ -22,13 +24,44 @@ class TransactionDataPullError(Exception):
 class TransactionDAO(ABC):
     """Abstract Base Class for pulling transaction data from bank accounts
 
+    Class Variables
+    ---------------
+    SUPPORTS_CONCURRENT_PULLS
+        Whether the checking account and credit card pulls may run at the same time on separate threads. Subclasses
+        should only enable this if their pull methods are thread-safe
+
     Methods
     -------
+    get_source_signature(month: int, year: int) -> Optional[tuple]
+        Return a value that changes whenever the transaction data for the period changes at its source
     pull_checking_account_transactions(month: int, year: int) -> pd.DataFrame
         Pull transaction data from checking account
     pull_credit_card_transactions(month: int, year: int) -> pd.DataFrame
         Pull transaction data from credit card account
     """
+    # Class variables
+    SUPPORTS_CONCURRENT_PULLS = False
+
+    def get_source_signature(self, month: int, year: int) -> Optional[tuple]:
+        """Return a value that changes whenever the transaction data for the period changes at its source
+
+        Subclasses that can cheaply tell whether their source has changed should override this. By default the
+        signature is unknown, so the transaction data is pulled every time it is requested.
+
+        Parameters
+        ----------
+        month : int
+            Month of the transaction data
+        year : int
+            Year of the transaction data
+
+        Returns
+        -------
+        Optional[tuple]
+            Signature of the transaction data at its source, or None if unknown
+        """
+        return None
+
     @abstractmethod
     def pull_checking_account_transactions(self, month: int, year: int) -> pd.DataFrame:
         """Pull transaction data from checking account
@@ -69,11 +102,25 @@ class TransactionDAO(ABC):
 class FlatFileTransactionDAO(TransactionDAO):
     """Concrete Implementation of TransactionDAO class for pulling bank account transaction data from flat files
 
+    Class Variables
+    ---------------
+    CHECKING_ACCT_COLUMNS
+        Columns of the checking account transaction data flat files that are used
+    CREDIT_CARD_COLUMNS
+        Columns of the credit card transaction data flat files that are used
+    SUPPORTS_CONCURRENT_PULLS
+        Pulls only read their own flat file, so they are safe to run concurrently
+
     Instance Variables
     ------------------
     tracker_root_path : str
         File path to root directory containing transaction data flat files
     """
+    # Class variables
+    CHECKING_ACCT_COLUMNS = frozenset({'Details', 'Posting Date', 'Description', 'Amount', 'Balance'})
+    CREDIT_CARD_COLUMNS = frozenset({'Transaction Date', 'Post Date', 'Description', 'Type', 'Amount'})
+    SUPPORTS_CONCURRENT_PULLS = True
+
     def __init__(self, tracker_root_path: str):
         """Constructor for FlatFileTransactionDAO class
 
@@ -86,6 +133,33 @@ class FlatFileTransactionDAO(TransactionDAO):
         self.tracker_root_path: str = tracker_root_path
 
     # Public methods
+    def get_source_signature(self, month: int, year: int) -> Optional[tuple]:
+        """Return a value that changes whenever either transaction data flat file for the period changes
+
+        Parameters
+        ----------
+        month : int
+            Month of the transaction data
+        year : int
+            Year of the transaction data
+
+        Returns
+        -------
+        Optional[tuple]
+            Modification time (in nanoseconds) and size of each transaction data flat file, or None if either file
+            cannot be found
+        """
+        mm = self.__format_month(month)
+        period_dir = self.__get_period_dir(mm, year)
+        # Keep each file's stats separate so that a change to either file changes the signature
+        try:
+            checking_acct_stat = os.stat(f"{period_dir}/checking_{mm}.csv")
+            credit_card_stat = os.stat(f"{period_dir}/credit_card_{mm}.csv")
+        except OSError:
+            return None
+        return ((checking_acct_stat.st_mtime_ns, checking_acct_stat.st_size),
+                (credit_card_stat.st_mtime_ns, credit_card_stat.st_size))
+
     def pull_checking_account_transactions(self, month: int, year: int) -> pd.DataFrame:
         """Pull transaction data from checking account
 
@@ -114,8 +188,10 @@ class FlatFileTransactionDAO(TransactionDAO):
         """
         mm = self.__format_month(month)
         try:
-            checking_acct_trx = pd.read_csv(f"{self.tracker_root_path}/{year}/{mm}_Transaction_Data/checking_{mm}.csv",
-                                            index_col=False)
+            # Select columns with a callable so that a missing column surfaces as a KeyError below
+            checking_acct_trx = pd.read_csv(f"{self.__get_period_dir(mm, year)}/checking_{mm}.csv", index_col=False,
+                                            usecols=lambda col: col in self.__class__.CHECKING_ACCT_COLUMNS,
+                                            dtype={'Details': 'category'})
             checking_acct_trx['Balance'] = pd.to_numeric(checking_acct_trx['Balance'], errors='coerce')
             checking_acct_trx['Posting Date'] = pd.to_datetime(checking_acct_trx['Posting Date'])
         except FileNotFoundError as fnfe:
@@ -128,7 +204,7 @@ class FlatFileTransactionDAO(TransactionDAO):
         except ValueError as ve:
             raise TransactionDataPullError(f"Unexpected value in checking account transaction \"Balance\" field. {ve}")
 
-        return checking_acct_trx.sort_values(by=['Posting Date'], ignore_index=True)
+        return self.__sort_by_posting_date(checking_acct_trx)
 
     def pull_credit_card_transactions(self, month: int, year: int) -> pd.DataFrame:
         """Pull transaction data from credit card account
@@ -156,8 +232,9 @@ class FlatFileTransactionDAO(TransactionDAO):
         """
         mm = self.__format_month(month)
         try:
-            credit_card_trx = pd.read_csv(f"{self.tracker_root_path}/{year}/{mm}_Transaction_Data/credit_card_{mm}.csv",
-                                          index_col=False)
+            credit_card_trx = pd.read_csv(f"{self.__get_period_dir(mm, year)}/credit_card_{mm}.csv", index_col=False,
+                                          usecols=lambda col: col in self.__class__.CREDIT_CARD_COLUMNS,
+                                          dtype={'Type': 'category'})
             credit_card_trx.rename(columns={'Post Date': 'Posting Date'}, inplace=True)
             credit_card_trx['Transaction Date'] = pd.to_datetime(credit_card_trx['Transaction Date'])
             credit_card_trx['Posting Date'] = pd.to_datetime(credit_card_trx['Posting Date'])
@@ -168,7 +245,7 @@ class FlatFileTransactionDAO(TransactionDAO):
         except ValueError as ve:
             raise TransactionDataPullError(f"Unexpected value in \"Transaction/Posting Date\" field. {ve}")
 
-        return credit_card_trx.sort_values(by=['Posting Date'], ignore_index=True)
+        return self.__sort_by_posting_date(credit_card_trx)
 
     # Private methods
     @staticmethod
@@ -185,7 +262,43 @@ class FlatFileTransactionDAO(TransactionDAO):
         str
             Two digit code for the month passed in (01-12)
         """
-        return str(month) if month >= 10 else f"0{str(month)}"
+        return f"{month:02d}"
+
+    def __get_period_dir(self, mm: str, year: int) -> str:
+        """Return the path to the directory containing the transaction data flat files for the period
+
+        Parameters
+        ----------
+        mm : str
+            Two digit code for the month of the transaction data (01-12)
+        year : int
+            Year of the transaction data
+
+        Returns
+        -------
+        str
+            File path to the directory containing the transaction data flat files for the period
+        """
+        return f"{self.tracker_root_path}/{year}/{mm}_Transaction_Data"
+
+    @staticmethod
+    def __sort_by_posting_date(trx: pd.DataFrame) -> pd.DataFrame:
+        """Sort transactions from earliest to latest Posting Date
+
+        Parameters
+        ----------
+        trx : pd.DataFrame
+            Transaction data with a default index
+
+        Returns
+        -------
+        pd.DataFrame
+            Transaction data sorted by Posting Date
+        """
+        # Bank exports are usually already in date order, in which case there is nothing to sort
+        if trx['Posting Date'].is_monotonic_increasing:
+            return trx
+        return trx.sort_values(by=['Posting Date'], ignore_index=True)
 
 
 class APITransactionDAO(TransactionDAO):
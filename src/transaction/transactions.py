@@ -2,17 +2,23 @@
 
 Classes
 -------
+TransactionsError
+    Class for exceptions that occur while pulling or processing the transactions for a time period
 Transactions
     Class for storing transactions that occurred within a specific time period
 """
-import logging
 import pandas as pd
-import sys
+import tracker.resources as tr
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from tracker.resources import CREDIT_CARD_KEYWORDS, EXPECTED_ERR_NO
+from typing import Optional
 from transaction.dao.transaction_dao import TransactionDAO, TransactionDataPullError
 
 
+class TransactionsError(Exception):
+    pass
+
+
 class Transactions:
     """Class for storing transactions that occurred within a specific time period
 
@@ -27,11 +33,11 @@ class Transactions:
 
     Public Methods
     --------------
-    get_as_of_date(self) -> datetime
+    get_as_of_date(self) -> Optional[datetime]
         Return the date of the most recent transaction
-    get_expenses(self) -> pd.DataFrame
+    get_expenses(self, copy: bool) -> pd.DataFrame
         Return the subset of transactions that are expenses
-    get_income(self) -> pd.DataFrame
+    get_income(self, copy: bool) -> pd.DataFrame
         Return the subset of transactions that are income
     get_num_checking_account_transactions(self) -> int
         Return the number of transactions that came from the checking account
@@ -50,20 +56,43 @@ class Transactions:
         self.__credit_card_trx: pd.DataFrame = pd.DataFrame()
         self.__income: pd.DataFrame = pd.DataFrame()
         self.__expenses: pd.DataFrame = pd.DataFrame()
-        self.__as_of_date: datetime = datetime.now()
+        self.__as_of_date: Optional[datetime] = None
+        self.__source_signature: Optional[tuple] = None
 
     # Public methods
-    def get_as_of_date(self) -> datetime:
-        """Return the date of the most recent transaction"""
+    def get_as_of_date(self) -> Optional[datetime]:
+        """Return the date of the most recent transaction, or None if transactions have not been pulled yet"""
         return self.__as_of_date
 
-    def get_expenses(self) -> pd.DataFrame:
-        """Return the subset of transactions that are expenses"""
-        return self.__expenses.copy()
+    def get_expenses(self, copy: bool = False) -> pd.DataFrame:
+        """Return the subset of transactions that are expenses
+
+        Parameters
+        ----------
+        copy : bool, default False
+            Whether to return a copy of the table. If False, the stored table is returned and should not be modified
+
+        Returns
+        -------
+        pd.DataFrame
+            Table of expense transactions for the period
+        """
+        return self.__expenses.copy() if copy else self.__expenses
+
+    def get_income(self, copy: bool = False) -> pd.DataFrame:
+        """Return the subset of transactions that are income
+
+        Parameters
+        ----------
+        copy : bool, default False
+            Whether to return a copy of the table. If False, the stored table is returned and should not be modified
 
-    def get_income(self) -> pd.DataFrame:
-        """Return the subset of transactions that are income"""
-        return self.__income.copy()
+        Returns
+        -------
+        pd.DataFrame
+            Table of income transactions for the period
+        """
+        return self.__income.copy() if copy else self.__income
 
     def get_num_checking_account_transactions(self) -> int:
         """Return the number of transactions that came from the checking account"""
@@ -76,18 +105,36 @@ class Transactions:
     def get_transactions_for_the_period(self):
         """Pull transactions for the period from bank account
 
+        The pull is skipped if the transaction data has not changed at its source since the previous pull.
+
         Raises
         ------
-        SystemExit
+        TransactionsError
             If error is encountered while pulling data
         """
+        # An unknown source signature can't be compared, so always pull in that case
+        source_signature = self.transaction_dao.get_source_signature(self.month, self.year)
+        if source_signature is not None and source_signature == self.__source_signature:
+            return
+
         try:
-            self.__checking_acct_trx = self.transaction_dao.pull_checking_account_transactions(self.month, self.year)
-            self.__credit_card_trx = self.transaction_dao.pull_credit_card_transactions(self.month, self.year)
+            # Run the two pulls concurrently if the DAO allows it
+            if self.transaction_dao.SUPPORTS_CONCURRENT_PULLS:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    checking_acct_pull = executor.submit(self.transaction_dao.pull_checking_account_transactions,
+                                                         self.month, self.year)
+                    credit_card_pull = executor.submit(self.transaction_dao.pull_credit_card_transactions,
+                                                       self.month, self.year)
+                    self.__checking_acct_trx = checking_acct_pull.result()
+                    self.__credit_card_trx = credit_card_pull.result()
+            else:
+                self.__checking_acct_trx = self.transaction_dao.pull_checking_account_transactions(self.month,
+                                                                                                   self.year)
+                self.__credit_card_trx = self.transaction_dao.pull_credit_card_transactions(self.month, self.year)
             self.__separate_income_from_expenses()
+            self.__source_signature = source_signature
         except TransactionDataPullError as tdpe:
-            logging.error(f"<{tdpe.__class__.__name__}> {tdpe}\n")
-            sys.exit(EXPECTED_ERR_NO)
+            raise TransactionsError(f"Unable to pull transactions for the period. {tdpe}") from tdpe
 
     # Private methods
     def __separate_income_from_expenses(self):
@@ -95,13 +142,13 @@ class Transactions:
 
         Raises
         ------
-        SystemExit
+        TransactionsError
             If columns of the transaction table do not match expectations
         """
-        checking = self.__checking_acct_trx.copy()
-        cc = self.__credit_card_trx.copy()
-        # Date, Description, and Amount columns are the 2nd, 3rd, and 4th columns respectively
-        column_selection = list(checking.columns[1:4])
+        checking = self.__checking_acct_trx
+        cc = self.__credit_card_trx
+        # Columns written to the tracker for each transaction
+        column_selection = ['Posting Date', 'Description', 'Amount']
 
         try:
             # Withdrawals from checking account are flagged as DEBIT in the Details column (bank's liability to me is
@@ -109,24 +156,21 @@ class Transactions:
             checking_expenses = checking.loc[checking['Details'] == 'DEBIT', column_selection]
             # Remove any withdrawals made to pay off credit card, since those expenses are being captured directly from
             # the credit card account
-            paying_off_cc_filter = list(map(lambda trx_desc: all(kywd not in trx_desc.upper() for kywd in
-                                                                 CREDIT_CARD_KEYWORDS),
-                                            checking_expenses['Description']))
-            checking_expenses = checking_expenses.loc[paying_off_cc_filter, :]
-            checking_expenses.reset_index(drop=True, inplace=True)
+            paying_off_cc_filter = checking_expenses['Description'].str.upper().str.contains(
+                tr.compile_keywords(tr.CREDIT_CARD_KEYWORDS), na=False)
+            checking_expenses = checking_expenses.loc[~paying_off_cc_filter.to_numpy(dtype=bool), :]
             # Expenses in the credit card account are flagged as 'Sale' in the Type column
-            cc_expenses = cc.loc[cc['Type'] == 'Sale', ['Posting Date', 'Description', 'Amount']].reset_index(drop=True)
-            self.__expenses = pd.concat([checking_expenses, cc_expenses]).sort_values(by=['Posting Date'],
-                                                                                      ignore_index=True)
+            cc_expenses = cc.loc[cc['Type'] == 'Sale', column_selection]
+            # Sort stably, keeping checking account expenses ahead of credit card expenses posted on the same date
+            self.__expenses = pd.concat([checking_expenses, cc_expenses], ignore_index=True).sort_values(
+                by=['Posting Date'], kind='mergesort', ignore_index=True)
 
             # Deposits to checking account are flagged as CREDIT in the Details column
             self.__income = checking.loc[checking['Details'] == 'CREDIT', column_selection].reset_index(drop=True)
 
             # Identify date of latest transaction and save it as the 'As of' date to post in the tracker
-            checking_latest_date = checking.iloc[-1, list(checking.columns).index('Posting Date')]
-            cc_latest_date = cc.iloc[-1, list(cc.columns).index('Posting Date')]
-            self.__as_of_date = checking_latest_date if checking_latest_date > cc_latest_date else cc_latest_date
+            latest_posting_date = pd.concat([checking['Posting Date'], cc['Posting Date']], ignore_index=True).max()
+            # If neither account has any transactions for the period, there is no date to report
+            self.__as_of_date = None if pd.isna(latest_posting_date) else latest_posting_date
         except KeyError as ke:
-            logging.error(f"<{ke.__class__.__name__}> Column not found in checking or credit card transaction tables: "
-                          f"{ke}")
-            sys.exit(EXPECTED_ERR_NO)
+            raise TransactionsError(f"Column not found in checking or credit card transaction tables: {ke}") from ke